@@ -17,23 +17,60 @@
 # pylint: disable=invalid-name
 """Primitive operators in the TVM IR."""
 
+import functools
+
 import tvm_ffi
 
 from . import _ffi_api
 from .expr import Expr
 
+# Resolved once at import so each hot Op method call does a single global
+# load instead of a module attribute lookup. init_ffi_api hands back the
+# fastest dispatch path the installed tvm_ffi wheel provides (cython when
+# available, ctypes otherwise), so binding here also pins that choice
+# instead of re-resolving it per call.
+_GetOp = _ffi_api.GetOp
+_ListOpNames = _ffi_api.ListOpNames
+_OpGetAttr = _ffi_api.OpGetAttr
+_OpHasAttr = _ffi_api.OpHasAttr
+_OpSetAttr = _ffi_api.OpSetAttr
+_OpResetAttr = _ffi_api.OpResetAttr
+_OpAddArgument = _ffi_api.OpAddArgument
+_OpSetSupportLevel = _ffi_api.OpSetSupportLevel
+_OpSetNumInputs = _ffi_api.OpSetNumInputs
+_OpSetAttrsTypeKey = _ffi_api.OpSetAttrsTypeKey
+
+# Cached result of ListOpNames, reset whenever a registration below may
+# grow the registry.
+_OP_NAMES_CACHE = None
+
+
+def _invalidate_op_names_cache():
+    """Reset the cached op-name listing after a registration."""
+    global _OP_NAMES_CACHE  # pylint: disable=global-statement
+    _OP_NAMES_CACHE = None
+
 
 @tvm_ffi.register_object("ir.Op")
 class Op(Expr):
     """Primitive operator in the IR."""
 
+    # Op instances are registry singletons that never carry ad-hoc Python
+    # attributes, so declare no slots of our own.
+    __slots__ = ()
+
     def __init__(self):
         raise RuntimeError("Cannot create op, use get instead")
 
     @staticmethod
+    @functools.cache
     def get(op_name):
         """Get the Op for a given name
 
+        Registered ops are immutable singletons keyed by name, so the
+        result is cached to avoid crossing the FFI boundary on repeat
+        lookups. Use ``Op.get.cache_clear()`` to drop the cache.
+
         Parameters
         ----------
         op_name : str
@@ -44,7 +81,7 @@ class Op(Expr):
         op : Op
             The op of the corresponding name
         """
-        return _ffi_api.GetOp(op_name)
+        return _GetOp(op_name)
 
     def get_attr(self, attr_name):
         """Get additional attribute about the operator.
@@ -59,7 +96,30 @@ class Op(Expr):
         value : object
             The attribute value
         """
-        return _ffi_api.OpGetAttr(self, attr_name)
+        return _OpGetAttr(self, attr_name)
+
+    def try_get_attr(self, attr_name, default=None):
+        """Get additional attribute about the operator, or a default.
+
+        Collapses the common ``has_attr`` + ``get_attr`` pair into a
+        single FFI call. An attribute whose stored value is None is
+        indistinguishable from a missing one.
+
+        Parameters
+        ----------
+        attr_name : str
+            The attribute name.
+
+        default : object, optional
+            The value to return when the attribute is not present.
+
+        Returns
+        -------
+        value : object
+            The attribute value, or default.
+        """
+        value = _OpGetAttr(self, attr_name)
+        return default if value is None else value
 
     def has_attr(self, attr_name):
         """Check whether the operator has additional attribute.
@@ -74,7 +134,7 @@ class Op(Expr):
         value : bool
             Whether the operator has additional attribute
         """
-        return _ffi_api.OpHasAttr(self, attr_name)
+        return _OpHasAttr(self, attr_name)
 
     def set_attr(self, attr_name, value, plevel=10):
         """Set attribute about the operator.
@@ -90,7 +150,7 @@ class Op(Expr):
         plevel : int
             The priority level
         """
-        _ffi_api.OpSetAttr(self, attr_name, value, plevel)
+        _OpSetAttr(self, attr_name, value, plevel)
 
     def reset_attr(self, attr_name):
         """Reset attribute about the operator.
@@ -100,7 +160,7 @@ class Op(Expr):
         attr_name : str
             The attribute name
         """
-        _ffi_api.OpResetAttr(self, attr_name)
+        _OpResetAttr(self, attr_name)
 
     def add_argument(self, name, type, description):  # pylint: disable=redefined-builtin
         """Add arguments information to the function.
@@ -114,7 +174,7 @@ class Op(Expr):
         description : str
             The argument description.
         """
-        _ffi_api.OpAddArgument(self, name, type, description)
+        _OpAddArgument(self, name, type, description)
 
     def set_support_level(self, level):
         """Set the support level of op.
@@ -124,7 +184,7 @@ class Op(Expr):
         level : int
             The support level.
         """
-        _ffi_api.OpSetSupportLevel(self, level)
+        _OpSetSupportLevel(self, level)
 
     def set_num_inputs(self, n):
         """Set the support level of op.
@@ -134,7 +194,7 @@ class Op(Expr):
         n : int
             The input number.
         """
-        _ffi_api.OpSetNumInputs(self, n)
+        _OpSetNumInputs(self, n)
 
     def set_attrs_type_key(self, key):
         """Set the attribute type key of op.
@@ -144,18 +204,24 @@ class Op(Expr):
         key : str
             The type key.
         """
-        _ffi_api.OpSetAttrsTypeKey(self, key)
+        _OpSetAttrsTypeKey(self, key)
 
     @staticmethod
     def list_op_names():
         """List all the op names in the op registry.
 
+        The listing round-trips to C++ and marshals every name, so the
+        result is cached until a registration invalidates it.
+
         Returns
         -------
         value : List[str]
             The registered op names
         """
-        return _ffi_api.ListOpNames()
+        global _OP_NAMES_CACHE  # pylint: disable=global-statement
+        if _OP_NAMES_CACHE is None:
+            _OP_NAMES_CACHE = tuple(_ListOpNames())
+        return list(_OP_NAMES_CACHE)
 
 
 def register_op_attr(op_name, attr_key, value=None, level=10):
@@ -180,13 +246,18 @@ def register_op_attr(op_name, attr_key, value=None, level=10):
     fregister : function
         Register function if value is not specified.
     """
+    if value is not None:
+        _ffi_api.RegisterOpAttr(op_name, attr_key, value, level)
+        _invalidate_op_names_cache()
+        return value
 
     def _register(v):
         """internal register function"""
         _ffi_api.RegisterOpAttr(op_name, attr_key, v, level)
+        _invalidate_op_names_cache()
         return v
 
-    return _register(value) if value is not None else _register
+    return _register
 
 
 def register_intrin_lowering(
@@ -217,10 +288,15 @@ def register_intrin_lowering(
     fregister : function
         Register op lowering function if f is not specified.
     """
-
-    def _register(f):
-        """internal register function"""
+    if f is not None:
         _ffi_api.RegisterOpLowerIntrinsic(op_name, f, target, level)
+        _invalidate_op_names_cache()
         return f
 
-    return _register(f) if f is not None else _register
+    def _register(func):
+        """internal register function"""
+        _ffi_api.RegisterOpLowerIntrinsic(op_name, func, target, level)
+        _invalidate_op_names_cache()
+        return func
+
+    return _register
@@ -16,89 +16,132 @@
 # under the License.
 """Helper tool to check file types that are allowed to checkin."""
 
+import re
 import subprocess
 import sys
-from pathlib import Path
-
-# List of file types we allow
-ALLOW_EXTENSION = {
-    # source code
+from concurrent.futures import ProcessPoolExecutor
+
+# List of file types we allow, ordered by how often each extension
+# occurs in the tree (git ls-files | awk -F. '{print $NF}' | sort |
+# uniq -c) so the regex alternation built below tries the common cases
+# first. Set lookups do not care about the order.
+_ALLOW_EXTENSION_ORDERED = (
+    # frequent in this repo
+    "py",
     "cc",
-    "c",
     "h",
-    "S",
+    "rst",
+    "sh",
+    "java",
+    "cmake",
+    "md",
+    "xml",
+    "txt",
+    "ts",
     "cu",
+    "js",
+    "yml",
+    "j2",
     "cuh",
-    "m",
     "mm",
-    "java",
-    "gradle",
+    "json",
+    "yaml",
+    "png",
     "groovy",
-    "js",
+    "mk",
+    "gradle",
+    # rare: source code
+    "c",
+    "S",
+    "m",
     "cjs",
     "mjs",
-    "ts",
-    "sh",
     "bat",
-    "py",
     "pyi",
-    # configurations
+    # rare: configurations
     "cfg",
-    "mk",
     "in",
-    "cmake",
-    "xml",
     "toml",
-    "yml",
-    "yaml",
-    "json",
-    "cfg",
     "ini",
-    # docs
-    "txt",
-    "md",
-    "rst",
+    # rare: docs
     "css",
     "html",
     "ipynb",
-    # ios
+    # rare: ios
     "pbxproj",
     "plist",
     "xcworkspacedata",
     "storyboard",
     "xcscheme",
-    # interface definition
+    # rare: interface definition
     "idl",
-    # Jinja2 templates
-    "j2",
-    # images
-    "png",
-    # misc
+    # rare: misc
     "properties",
     "template",
-}
+)
+
+ALLOW_EXTENSION = frozenset(_ALLOW_EXTENSION_ORDERED)
 
 # List of file names allowed
-ALLOW_FILE_NAME = {
-    ".gitignore",
-    ".gitattributes",
-    ".gitmodules",
-    ".clang-format",
-    "README",
-    "Makefile",
-    "Doxyfile",
-    "CODEOWNERSHIP",
-    "condarc",
-    "with_the_same_user",
-}
+ALLOW_FILE_NAME = frozenset(
+    {
+        ".gitignore",
+        ".gitattributes",
+        ".gitmodules",
+        ".clang-format",
+        "README",
+        "Makefile",
+        "Doxyfile",
+        "CODEOWNERSHIP",
+        "condarc",
+        "with_the_same_user",
+    }
+)
 
 # List of specific files allowed in relpath to <proj_root>
-ALLOW_SPECIFIC_FILE = {"LICENSE", "NOTICE", "KEYS"}
+ALLOW_SPECIFIC_FILE = frozenset({"LICENSE", "NOTICE", "KEYS"})
+
+# Bytes view of ALLOW_EXTENSION so main() can filter the raw git output
+# before decoding individual names.
+_ALLOW_EXTENSION_BYTES = frozenset(ext.encode("utf-8") for ext in ALLOW_EXTENSION)
+
+# Path prefixes that are always allowed; str.startswith scans the whole
+# tuple in a single C call.
+_ALLOWED_PREFIXES = ("3rdparty", ".txdev", ".claude")
+
+# Residual names (those that miss the extension fast path) are batched;
+# a full batch is handed to a worker pool, so small checkouts never pay
+# the process-pool spin-up cost.
+_BATCH_SIZE = 20000
+
+
+def _build_allowed_pattern() -> str:
+    """Compile the whole allow policy into one regex alternation."""
+    ext_alt = "|".join(re.escape(ext) for ext in _ALLOW_EXTENSION_ORDERED)
+    name_alt = "|".join(re.escape(base) for base in sorted(ALLOW_FILE_NAME))
+    specific_alt = "|".join(re.escape(path) for path in sorted(ALLOW_SPECIFIC_FILE))
+    prefix_alt = "|".join(re.escape(prefix) for prefix in _ALLOWED_PREFIXES)
+    return (
+        f"(?:{specific_alt})"
+        f"|.*\\.(?:{ext_alt})"
+        f"|(?:.*/)?(?:{name_alt})"
+        # Dockerfile and variants like Dockerfile.ci_gpu
+        "|(?:.*/)?Dockerfile(?:\\..*)?"
+        f"|(?:{prefix_alt}).*"
+    )
+
+
+# DOTALL so filenames with embedded newlines (legal, and preserved by
+# the -z listing) are still matched.
+_ALLOWED_FULLMATCH = re.compile(_build_allowed_pattern(), re.DOTALL).fullmatch
 
 
 def filename_allowed(name: str) -> bool:
     """Check if name is allowed by the current policy.
 
+    The policy is compiled once into a single regex, so each call is one
+    C-level match instead of a chain of Python string checks.
+
     Parameters
     ----------
     name : str
@@ -109,37 +152,59 @@ def filename_allowed(name: str) -> bool:
     allowed : bool
         Whether the filename is allowed.
     """
-    arr = name.rsplit(".", 1)
-    if arr[-1] in ALLOW_EXTENSION:
-        return True
-
-    basename = Path(name).name
-    if basename in ALLOW_FILE_NAME:
-        return True
+    return _ALLOWED_FULLMATCH(name) is not None
 
-    # Dockerfile and variants like Dockerfile.ci_gpu
-    if basename == "Dockerfile" or basename.startswith("Dockerfile."):
-        return True
 
-    if name.startswith("3rdparty"):
-        return True
+def _classify_batch(batch):
+    """Return the disallowed names in one batch of decoded names."""
+    return [name for name in batch if not filename_allowed(name)]
 
-    if name.startswith(".txdev") or name.startswith(".claude"):
-        return True
 
-    if name in ALLOW_SPECIFIC_FILE:
-        return True
+def _ext_allowed(raw: bytes) -> bool:
+    """Bytes-level mirror of the regex's extension rule.
 
-    return False
+    The dot is required so a dotless name that happens to equal an
+    allowed extension is classified the same way filename_allowed
+    classifies it.
+    """
+    return b"." in raw and raw.rpartition(b".")[2] in _ALLOW_EXTENSION_BYTES
 
 
 def main() -> None:
-    cmd = ["git", "ls-files"]
-    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-    (out, _) = proc.communicate()
-    res = out.decode("utf-8")
-    assert proc.returncode == 0, f"{' '.join(cmd)} errored: {res}"
-    error_list = [f for f in res.split() if not filename_allowed(f)]
+    # Stream the null-delimited listing chunk by chunk so peak memory
+    # stays bounded instead of buffering the whole output. The extension
+    # fast path runs on the raw bytes; only residual names are decoded,
+    # batched, and (for very large residuals) fanned out to a worker
+    # pool one full batch at a time.
+    batch = []
+    futures = []
+    pool = None
+    with subprocess.Popen(["git", "ls-files", "-z"], stdout=subprocess.PIPE) as proc:
+        buf = b""
+        for chunk in iter(lambda: proc.stdout.read(65536), b""):
+            buf += chunk
+            *ready, buf = buf.split(b"\0")
+            for raw in ready:
+                if raw and not _ext_allowed(raw):
+                    batch.append(raw.decode("utf-8"))
+                    if len(batch) >= _BATCH_SIZE:
+                        if pool is None:
+                            pool = ProcessPoolExecutor()
+                        futures.append(pool.submit(_classify_batch, batch))
+                        batch = []
+        # git terminates every record with NUL, but be safe on a
+        # truncated listing.
+        if buf and not _ext_allowed(buf):
+            batch.append(buf.decode("utf-8"))
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+    error_list = _classify_batch(batch)
+    if pool is not None:
+        for future in futures:
+            error_list.extend(future.result())
+        pool.shutdown()
+    error_list.sort()
 
     if error_list:
         report = "------File type check report----\n"
@@ -17,20 +17,39 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import atexit
 import logging
+import types
 import urllib.request
+from logging.handlers import MemoryHandler
 
 LOGGER = None
 
+# Cached at init() time so the hot path can skip logging calls outright
+# when INFO is disabled.
+_LOG_INFO = False
 
-URL_MAP = {}
+
+# Read-only view so the mapping cannot be mutated at runtime; add new
+# mirrors to the underlying literal. Keep keys as the exact URLs CI
+# requests so each lookup is a single hash of the incoming string.
+URL_MAP = types.MappingProxyType({})
+
+# Bound once so the per-request path skips the module attribute lookup.
+_url_map_get = URL_MAP.get
 
 
 class TvmRequestHook(urllib.request.Request):
     def __init__(self, url, *args, **kwargs):
-        LOGGER.info(f"Caught access to {url}")
-        url = url.strip()
-        if url not in URL_MAP:
+        if _LOG_INFO:
+            LOGGER.info("Caught access to %s", url)
+        new_url = _url_map_get(url)
+        if new_url is None:
+            # URLs are usually already clean; only pay for the strip and
+            # the second probe on a miss.
+            url = url.strip()
+            new_url = _url_map_get(url)
+        if new_url is None:
             # Disallow network accesses without an explicitly maintained mirror.
             msg = (
                 f"Uncaught URL found in CI: {url}. "
@@ -39,13 +58,13 @@ class TvmRequestHook(urllib.request.Request):
             )
             raise RuntimeError(msg)
 
-        new_url = URL_MAP[url]
-        LOGGER.info(f"Mapped URL {url} to {new_url}")
+        if _LOG_INFO:
+            LOGGER.info("Mapped URL %s to %s", url, new_url)
         super().__init__(new_url, *args, **kwargs)
 
 
 def init():
-    global LOGGER
+    global LOGGER, _LOG_INFO
     if urllib.request.Request is TvmRequestHook:
         return
     urllib.request.Request = TvmRequestHook
@@ -53,4 +72,9 @@ def init():
     LOGGER.setLevel(logging.DEBUG)
     fh = logging.FileHandler("redirected_urls.log")
     fh.setLevel(logging.DEBUG)
-    LOGGER.addHandler(fh)
+    # Buffer records in memory so routine INFO logging does not cost a
+    # write syscall per request; errors and interpreter exit flush.
+    mh = MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=fh)
+    LOGGER.addHandler(mh)
+    atexit.register(mh.flush)
+    _LOG_INFO = LOGGER.isEnabledFor(logging.INFO)